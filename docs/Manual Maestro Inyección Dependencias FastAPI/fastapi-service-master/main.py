@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from src import router
-from src.database import create_db_and_tables, close_db_connection
+from src.database import create_db_and_tables, close_db_connection, create_pg_pool, warm_up_pool
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -9,8 +10,13 @@ async def lifespan(app: FastAPI):
     # Startup: Crear tablas
     await create_db_and_tables()
     print("Database tables created")
+    # Startup: Precalentar el pool de conexiones
+    await warm_up_pool()
+    # Startup: Pool asyncpg para lecturas rápidas
+    app.state.pg_pool = await create_pg_pool()
     yield
-    # Shutdown: Cerrar conexión
+    # Shutdown: Cerrar pool y conexión
+    await app.state.pg_pool.close()
     await close_db_connection()
     print("Database connection closed")
 
@@ -18,7 +24,8 @@ app = FastAPI(
     title="ServiceMaster API",
     description="API de gestión de tickets con Dependency Injection",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serializa bastante más rápido que json estándar
 )
 
 app.include_router(router)
\ No newline at end of file
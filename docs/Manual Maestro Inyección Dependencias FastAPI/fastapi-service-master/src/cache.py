@@ -0,0 +1,40 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+from src.config import get_settings
+
+class TTLCache:
+    """Caché en memoria del proceso con expiración (TTL) y tamaño máximo"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Devolver el valor si existe y no ha expirado"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guardar un valor; si se supera maxsize se descarta el más antiguo"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Invalidar todas las entradas"""
+        self._data.clear()
+
+# Caché de lecturas de tickets (una por proceso/worker)
+# Con varios workers cada uno invalida solo la suya: las lecturas pueden
+# quedar desfasadas como máximo CACHE_TTL_SECONDS
+tickets_cache = TTLCache(ttl=get_settings().CACHE_TTL_SECONDS)
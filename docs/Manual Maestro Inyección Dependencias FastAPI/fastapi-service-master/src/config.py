@@ -1,5 +1,5 @@
-from functools import lru_cache
 from typing import Annotated
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from fastapi import Depends
 
@@ -12,14 +12,43 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DEBUG_MODE: bool = False
+    # Pools de conexiones (por proceso/worker): el de SQLAlchemy y el de asyncpg
+    # Conexiones totales = UVICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW + PG_FAST_POOL_MAX)
+    # Con los valores por defecto y 4 workers: 4 * (5 + 5 + 5) = 60 conexiones como máximo
+    # (40 abiertas al arrancar), dentro de las 97 que deja un PostgreSQL por defecto
+    # (max_connections=100 menos 3 reservadas)
+    UVICORN_WORKERS: int = 1
+    DB_MAX_CONNECTIONS: int = 97
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    # Pool asyncpg de las lecturas rápidas (get_by_id_fast)
+    PG_FAST_POOL_MAX: int = 5
+    # Caché en memoria de lecturas de tickets
+    CACHE_TTL_SECONDS: int = 30
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
-# Factoría de cache
-# lru_cache asegura que solo leamos la configuración una vez
-@lru_cache
+    @model_validator(mode="after")
+    def check_connection_budget(self) -> "Settings":
+        # Fallar al arrancar en lugar de agotar max_connections de PostgreSQL en producción
+        per_worker = self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW + self.PG_FAST_POOL_MAX
+        total = self.UVICORN_WORKERS * per_worker
+        if total > self.DB_MAX_CONNECTIONS:
+            raise ValueError(
+                f"UVICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW + PG_FAST_POOL_MAX) = "
+                f"{self.UVICORN_WORKERS} * {per_worker} = {total} supera DB_MAX_CONNECTIONS={self.DB_MAX_CONNECTIONS}"
+            )
+        return self
+
+# Instancia única, creada al importar el módulo: la configuración se lee una sola vez
+SETTINGS: Settings = Settings()
+
+# Se mantiene como función para poder usarla en Depends y sobreescribirla en tests
+# (dependency_overrides); devuelve la instancia ya creada sin pasar por lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return SETTINGS
 
 # Poder usar SettingsDep en cualquier lugar sin reescribir la dependencia
 SettingsDep = Annotated[Settings, Depends(get_settings)]
@@ -1,26 +1,38 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Annotated
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+import asyncpg
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
-from fastapi import Depends
+from fastapi import Depends, Request
 from src.config import get_settings
 
 settings = get_settings()
 
+# Los endpoints son async: un driver síncrono (psycopg2) bloquearía el event loop
+if not settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    raise ValueError("DATABASE_URL debe usar el driver asíncrono 'postgresql+asyncpg://'")
+
 # Crear el motor de la base de datos asíncrona
+# El pool se dimensiona desde Settings; los valores por defecto de SQLAlchemy
+# (pool_size=5, max_overflow=10) se agotan rápido con muchas peticiones concurrentes
 async_engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG_MODE,
-    future=True
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,  # Descarta conexiones muertas antes de usarlas
+    echo=settings.DEBUG_MODE
 )
 
 # Factoría de sesiones (no es la sesión en sí, es el creador de sesiones)
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine,
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
     class_=AsyncSession,
-    expire_on_commit=False
+    expire_on_commit=False,
+    autoflush=False
 )
 
 # Dependency Injection Core
@@ -28,12 +40,10 @@ AsyncSessionLocal = sessionmaker(
 # FastAPI ejecutará lo que está ANTES del yield al iniciar el request.
 # Entregará la sesión al endpoint.
 # Ejecutará lo que está DESPUÉS del yield al finalizar el request (incluso si hubo error)
+# El propio "async with" cierra la sesión, no hace falta un close() manual
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 # Funciones para gestionar el ciclo de vida de la base de datos
 async def create_db_and_tables():
@@ -41,9 +51,34 @@ async def create_db_and_tables():
     async with async_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
+async def warm_up_pool():
+    # El pool de SQLAlchemy abre conexiones bajo demanda: se llenan al arrancar
+    # para que las primeras peticiones no paguen el handshake con PostgreSQL
+    conns = await asyncio.gather(*(async_engine.connect() for _ in range(settings.DB_POOL_SIZE)))
+    # Al cerrarlas vuelven al pool (no se desconectan)
+    await asyncio.gather(*(conn.close() for conn in conns))
+
 async def close_db_connection():
     # Cerrar la conexión con la base de datos
     await async_engine.dispose()
 
+# Pool asyncpg "crudo" para las lecturas más frecuentes
+# Evita la compilación del ORM y aprovecha la caché de sentencias preparadas de asyncpg
+async def create_pg_pool() -> asyncpg.Pool:
+    # asyncpg no entiende el sufijo "+asyncpg" de SQLAlchemy
+    dsn = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+    # Pool independiente del de SQLAlchemy: sus conexiones cuentan aparte
+    return await asyncpg.create_pool(
+        dsn,
+        min_size=min(5, settings.PG_FAST_POOL_MAX),
+        max_size=settings.PG_FAST_POOL_MAX,
+        statement_cache_size=1024
+    )
+
+def get_pg_pool(request: Request) -> asyncpg.Pool | None:
+    # None si el lifespan no creó el pool (p. ej. en tests con ASGITransport)
+    return getattr(request.app.state, "pg_pool", None)
+
 # Type alias para dependency injection
-SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
\ No newline at end of file
+SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+PgPoolDep = Annotated[asyncpg.Pool | None, Depends(get_pg_pool)]
\ No newline at end of file
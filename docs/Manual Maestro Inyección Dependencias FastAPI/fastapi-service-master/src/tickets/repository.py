@@ -1,41 +1,108 @@
-from sqlmodel import select
-from sqlmodel.ext.asyncio.session import AsyncSession
-from src.database import get_db_session
+from sqlmodel import delete, or_, select, update
+from src.database import PgPoolDep, SessionDep
 from src.tickets.models import Ticket
-from typing import List
-from fastapi import Depends
+from typing import Any, List
+from collections.abc import Mapping, Sequence
 
 class TicketRepository:
     """Capa de repositorio: Maneja el acceso a datos"""
     
-    def __init__(self, session: AsyncSession = Depends(get_db_session)):
+    # Dependencias vía Annotated (SessionDep/PgPoolDep), la forma recomendada;
+    # el None por defecto solo aplica al instanciar el repositorio a mano (tests)
+    def __init__(self, session: SessionDep, pool: PgPoolDep = None):
         self.session = session
+        self.pool = pool
 
     async def create(self, ticket: Ticket) -> Ticket:
         """Crear un nuevo ticket en la base de datos"""
         self.session.add(ticket)
+        # El flush emite INSERT ... RETURNING id y rellena la PK en el mismo viaje;
+        # con expire_on_commit=False no hace falta un refresh (SELECT extra)
+        await self.session.flush()
         await self.session.commit()
-        await self.session.refresh(ticket)
         return ticket
     
+    async def create_many(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crear varios tickets con un único commit"""
+        self.session.add_all(tickets)
+        await self.session.flush()
+        await self.session.commit()
+        return tickets
+    
     async def get_by_id(self, ticket_id: int) -> Ticket | None:
         """Obtener un ticket por ID"""
         return await self.session.get(Ticket, ticket_id)
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Ticket]:
-        """Obtener todos los tickets con paginación"""
-        statement = select(Ticket).offset(skip).limit(limit)
+    async def get_by_id_fast(self, ticket_id: int) -> Ticket | None:
+        """Obtener un ticket por ID para solo lectura (asyncpg directo, sin identity map)"""
+        if self.pool is None:
+            return await self.get_by_id(ticket_id)
+        row = await self.pool.fetchrow(
+            "SELECT id, title, description, is_completed, priority FROM ticket WHERE id = $1",
+            ticket_id
+        )
+        return Ticket(**dict(row)) if row else None
+    
+    async def get_all(self, after_id: int | None = None, limit: int = 100) -> List[Ticket]:
+        """Obtener todos los tickets con paginación por cursor (keyset)"""
+        statement = select(Ticket)
+        if after_id is not None:
+            statement = statement.where(Ticket.id > after_id)
+        statement = statement.order_by(Ticket.id).limit(limit)
         result = await self.session.exec(statement)
         return list(result.all())
     
+    async def get_all_dicts(self, after_id: int | None = None, limit: int = 100) -> Sequence[Mapping[str, Any]]:
+        """Obtener tickets como filas planas (sin objetos ORM ni identity map), para solo lectura"""
+        # WHERE id > cursor usa el índice de la PK; OFFSET tendría que recorrer las filas saltadas
+        statement = select(
+            Ticket.id,
+            Ticket.title,
+            Ticket.description,
+            Ticket.is_completed,
+            Ticket.priority
+        )
+        if after_id is not None:
+            statement = statement.where(Ticket.id > after_id)
+        statement = statement.order_by(Ticket.id).limit(limit)
+        result = await self.session.exec(statement)
+        return result.mappings().all()
+    
     async def update(self, ticket: Ticket) -> Ticket:
         """Actualizar un ticket existente"""
         self.session.add(ticket)
         await self.session.commit()
-        await self.session.refresh(ticket)
+        return ticket
+    
+    async def update_by_id(self, ticket_id: int, data: dict[str, Any]) -> Ticket | None:
+        """Actualizar un ticket por ID en un solo viaje (UPDATE ... RETURNING)
+        
+        Solo toca la fila si algún campo enviado cambia (IS DISTINCT FROM), así un
+        reintento con los mismos valores no escribe. Devuelve None si no se actualizó
+        ninguna fila: el ticket no existe o ya tenía esos valores.
+        """
+        statement = (
+            update(Ticket)
+            .where(Ticket.id == ticket_id)
+            .where(or_(*(getattr(Ticket, field).is_distinct_from(value) for field, value in data.items())))
+            .values(**data)
+            .returning(Ticket)
+        )
+        result = await self.session.exec(statement)
+        ticket = result.scalar_one_or_none()
+        if ticket is not None:
+            await self.session.commit()
         return ticket
     
     async def delete(self, ticket: Ticket) -> None:
         """Eliminar un ticket"""
         await self.session.delete(ticket)
-        await self.session.commit()
\ No newline at end of file
+        await self.session.commit()
+    
+    async def delete_by_id(self, ticket_id: int) -> int | None:
+        """Eliminar un ticket por ID en un solo viaje (DELETE ... RETURNING id)"""
+        statement = delete(Ticket).where(Ticket.id == ticket_id).returning(Ticket.id)
+        result = await self.session.exec(statement)
+        deleted_id = result.scalar_one_or_none()
+        await self.session.commit()
+        return deleted_id
@@ -1,5 +1,7 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from src.tickets.schemas import TicketCreate, TicketRead, TicketUpdate
 from src.tickets.service import TicketService
 
@@ -11,15 +13,30 @@ router = APIRouter(
 # Alias para inyectar el servicio - Dependency Injection
 TicketServiceDep = Annotated[TicketService, Depends()]
 
+# Serializador de listas compilado una sola vez: vuelca la lista entera en una pasada de pydantic-core
+TICKETS_ADAPTER = TypeAdapter(list[TicketRead])
+
 @router.post( "/", response_model=TicketRead, status_code=status.HTTP_201_CREATED, summary="Create a new ticket")
 async def create_ticket( ticket_in: TicketCreate, service: TicketServiceDep ) -> TicketRead:
     """Crear un nuevo ticket. Si el título contiene 'CRITICAL' o 'URGENTE', se asigna prioridad 5 automáticamente."""
     return await service.create_ticket(ticket_in)
 
-@router.get("/", response_model=list[TicketRead], summary="Get all tickets")
-async def get_all_tickets(service: TicketServiceDep, skip: int = Query(default=0, ge=0, description="Número de registros a saltar"), limit: int = Query(default=100, ge=1, le=100, description="Número máximo de registros a retornar")) -> list[TicketRead]:
-    """Obtener todos los tickets con paginación."""
-    return await service.get_all_tickets(skip=skip, limit=limit)
+@router.post("/bulk", response_model=list[TicketRead], status_code=status.HTTP_201_CREATED, summary="Create many tickets")
+async def create_tickets_bulk(tickets_in: list[TicketCreate], service: TicketServiceDep) -> list[TicketRead]:
+    """Crear varios tickets en una sola transacción. Aplica la misma regla de prioridad que la creación individual."""
+    return await service.create_many(tickets_in)
+
+# response_model=None: el servicio ya construye TicketRead sin validar (model_construct),
+# así FastAPI no vuelve a validar cada fila; "responses" mantiene el esquema en /docs
+@router.get("/", response_model=None, responses={200: {"model": list[TicketRead]}}, summary="Get all tickets")
+async def get_all_tickets(service: TicketServiceDep, after_id: int | None = Query(default=None, ge=0, description="Cursor: ID del último ticket de la página anterior"), limit: int = Query(default=100, ge=1, le=100, description="Número máximo de registros a retornar")) -> ORJSONResponse:
+    """Obtener todos los tickets con paginación por cursor. Si hay más páginas, la cabecera X-Next-Cursor trae el valor para `after_id`."""
+    tickets = await service.get_all_tickets(after_id=after_id, limit=limit)
+    # Devolver la respuesta directamente evita el paso por jsonable_encoder
+    response = ORJSONResponse(TICKETS_ADAPTER.dump_python(tickets, mode="json"))
+    if len(tickets) == limit:
+        response.headers["X-Next-Cursor"] = str(tickets[-1].id)
+    return response
 
 @router.get("/{ticket_id}", response_model=TicketRead, summary="Get a ticket by ID")
 async def get_ticket(ticket_id: int, service: TicketServiceDep) -> TicketRead:
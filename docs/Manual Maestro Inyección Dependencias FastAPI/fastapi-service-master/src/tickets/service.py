@@ -1,7 +1,21 @@
+import asyncio
+import re
 from fastapi import Depends, HTTPException, status
+from src.cache import tickets_cache
+from src.config import get_settings
+from src.database import AsyncSessionLocal
 from src.tickets.repository import TicketRepository
 from src.tickets.models import Ticket
-from src.tickets.schemas import TicketCreate, TicketUpdate
+from src.tickets.schemas import TicketCreate, TicketRead, TicketUpdate
+
+# Palabras clave que fuerzan prioridad máxima (una sola pasada, sin .upper())
+_CRITICAL_RE = re.compile(r"CRITICAL|URGENTE", re.IGNORECASE)
+
+# Lecturas simultáneas de get_tickets_by_ids: la mitad del pool más pequeño
+# (asyncpg o SQLAlchemy), para que una petición con muchos IDs no deje sin
+# conexiones al resto de peticiones del worker
+_settings = get_settings()
+_BATCH_READ_CONCURRENCY = max(1, min(_settings.PG_FAST_POOL_MAX, _settings.DB_POOL_SIZE) // 2)
 
 class TicketService:
     """Capa de servicio: Contiene la lógica de negocio"""
@@ -9,49 +23,106 @@ class TicketService:
     def __init__(self, repo: TicketRepository = Depends()):
         self.repo = repo
 
-    async def create_ticket(self, ticket_data: TicketCreate) -> Ticket:
-        """Crear un ticket con lógica de negocio"""
+    @staticmethod
+    def _build_ticket(ticket_data: TicketCreate) -> Ticket:
+        """Construir el modelo de base de datos aplicando las reglas de negocio"""
         # Lógica de negocio: Auto-asignar prioridad alta si es crítico
         priority = ticket_data.priority
-        if "CRITICAL" in ticket_data.title.upper() or "URGENTE" in ticket_data.title.upper():
+        if _CRITICAL_RE.search(ticket_data.title):
             priority = 5
         
         # Crear instancia del modelo de base de datos
-        ticket_db = Ticket(
+        return Ticket(
             title=ticket_data.title,
             description=ticket_data.description,
             priority=priority
         )
-        
-        return await self.repo.create(ticket_db)
+
+    async def create_ticket(self, ticket_data: TicketCreate) -> Ticket:
+        """Crear un ticket con lógica de negocio"""
+        ticket = await self.repo.create(self._build_ticket(ticket_data))
+        tickets_cache.clear()
+        return ticket
+    
+    async def create_many(self, tickets_in: list[TicketCreate]) -> list[Ticket]:
+        """Crear varios tickets en una sola transacción"""
+        tickets = [self._build_ticket(ticket_data) for ticket_data in tickets_in]
+        created = await self.repo.create_many(tickets)
+        tickets_cache.clear()
+        return created
     
     async def get_ticket(self, ticket_id: int) -> Ticket:
-        """Obtener un ticket por ID"""
-        ticket = await self.repo.get_by_id(ticket_id)
+        """Obtener un ticket por ID (solo lectura, cacheado)"""
+        cache_key = ("ticket", ticket_id)
+        ticket = tickets_cache.get(cache_key)
+        if ticket is None:
+            ticket = self._ensure_found(await self.repo.get_by_id_fast(ticket_id), ticket_id)
+            tickets_cache.set(cache_key, ticket)
+        return ticket
+    
+    async def get_tickets_by_ids(self, ticket_ids: list[int]) -> list[Ticket | None]:
+        """Obtener varios tickets en paralelo (None para los que no existen)"""
+        semaphore = asyncio.Semaphore(_BATCH_READ_CONCURRENCY)
+        
+        async def fetch_one(ticket_id: int) -> Ticket | None:
+            # Misma caché que get_ticket: los IDs ya cacheados no van a la DB
+            cache_key = ("ticket", ticket_id)
+            ticket = tickets_cache.get(cache_key)
+            if ticket is not None:
+                return ticket
+            # Una AsyncSession no se puede compartir entre tareas concurrentes:
+            # cada lectura abre su propia sesión (y conexión) del pool
+            async with semaphore, AsyncSessionLocal() as session:
+                ticket = await TicketRepository(session, self.repo.pool).get_by_id_fast(ticket_id)
+            if ticket is not None:
+                tickets_cache.set(cache_key, ticket)
+            return ticket
+        
+        return list(await asyncio.gather(*(fetch_one(ticket_id) for ticket_id in ticket_ids)))
+    
+    @staticmethod
+    def _not_found(ticket_id: int) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ticket with id {ticket_id} not found"
+        )
+    
+    @classmethod
+    def _ensure_found(cls, ticket: Ticket | None, ticket_id: int) -> Ticket:
         if not ticket:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Ticket with id {ticket_id} not found"
-            )
+            raise cls._not_found(ticket_id)
         return ticket
     
-    async def get_all_tickets(self, skip: int = 0, limit: int = 100) -> list[Ticket]:
-        """Obtener todos los tickets con paginación"""
-        return await self.repo.get_all(skip=skip, limit=limit)
+    async def get_all_tickets(self, after_id: int | None = None, limit: int = 100) -> list[TicketRead]:
+        """Obtener todos los tickets con paginación por cursor (cacheado)"""
+        cache_key = ("list", after_id, limit)
+        tickets = tickets_cache.get(cache_key)
+        if tickets is None:
+            rows = await self.repo.get_all_dicts(after_id=after_id, limit=limit)
+            # Las filas vienen de la DB y ya están tipadas: model_construct evita re-validarlas
+            tickets = [TicketRead.model_construct(**row) for row in rows]
+            tickets_cache.set(cache_key, tickets)
+        return tickets
     
     async def update_ticket(self, ticket_id: int, ticket_data: TicketUpdate) -> Ticket:
-        """Actualizar un ticket"""
-        ticket = await self.get_ticket(ticket_id)
-        
+        """Actualizar un ticket (sin leerlo antes: un solo UPDATE ... RETURNING)"""
         # Actualizar solo los campos proporcionados
         update_data = ticket_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(ticket, field, value)
+        if not update_data:
+            # PUT sin campos: nada que persistir ni que invalidar
+            return await self.get_ticket(ticket_id)
         
-        return await self.repo.update(ticket)
+        ticket = await self.repo.update_by_id(ticket_id, update_data)
+        if ticket is None:
+            # Ninguna fila cambió: o el ticket no existe (get_ticket lanza 404)
+            # o ya tenía esos valores (PUT idempotente/reintento: nada que invalidar)
+            return await self.get_ticket(ticket_id)
+        tickets_cache.clear()
+        return ticket
     
     async def delete_ticket(self, ticket_id: int) -> None:
-        """Eliminar un ticket"""
-        ticket = await self.get_ticket(ticket_id)
-        await self.repo.delete(ticket)
+        """Eliminar un ticket (un solo DELETE ... RETURNING id)"""
+        if await self.repo.delete_by_id(ticket_id) is None:
+            raise self._not_found(ticket_id)
+        tickets_cache.clear()
         
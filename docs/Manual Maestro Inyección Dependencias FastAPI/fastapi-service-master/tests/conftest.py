@@ -15,13 +15,16 @@ sys.path.insert(0, str(root_dir))
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
+from unittest.mock import AsyncMock
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from httpx import AsyncClient, ASGITransport
 
 from main import app
+from src.cache import tickets_cache
 from src.database import get_db_session
 from src.tickets.models import Ticket
 
@@ -30,43 +33,75 @@ from src.tickets.models import Ticket
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_engine():
-    # Crear motor de base de datos para tests (SQLite en memoria).
+    # Crear motor de base de datos para tests (SQLite en memoria), UNA vez por sesión.
+    # StaticPool: todas las conexiones comparten la misma base de datos en memoria.
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
-        future=True
+        poolclass=StaticPool
     )
     
+    # pysqlite/aiosqlite gestionan BEGIN por su cuenta y rompen los SAVEPOINT;
+    # se desactiva y se emite BEGIN desde SQLAlchemy (receta oficial de SQLAlchemy)
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    # PRAGMAs de rendimiento: en :memory: WAL no aplica (queda en "memory"),
+    # pero si TEST_DATABASE_URL apunta a un fichero las escrituras son mucho más rápidas
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+    
     # Crear todas las tablas
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
     
     yield engine
     
-    # Limpiar después de los tests
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-    
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    # Crear sesión de base de datos para tests.
-    async_session = sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
+    # Sesión de base de datos para tests, aislada en una transacción que se revierte.
+    # Los commit() del código se convierten en SAVEPOINTs, así nada queda persistido.
+    conn = await test_engine.connect()
+    trans = await conn.begin()
+    session = AsyncSession(
+        bind=conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
     )
     
-    async with async_session() as session:
-        yield session
+    yield session
+    
+    await session.close()
+    await trans.rollback()
+    await conn.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client_base() -> AsyncGenerator[AsyncClient, None]:
+    # Cliente HTTP compartido por toda la sesión de tests.
+    # No se ejecuta el lifespan de la app: crearía tablas y el pool asyncpg
+    # contra el PostgreSQL real; los tests usan su propia base de datos.
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(client_base: AsyncClient, test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     
     # Cliente HTTP de pruebas con override de la dependencia de DB.
     # Esto asegura que todos los endpoints usen la base de datos de pruebas.
@@ -77,13 +112,18 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None
     
     app.dependency_overrides[get_db_session] = override_get_db
     
-    # Crear cliente HTTP para tests
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield client_base
     
-    # Limpiar overrides
-    app.dependency_overrides.clear()
+    # Quitar solo el override de este test
+    app.dependency_overrides.pop(get_db_session, None)
+
+
+@pytest.fixture(autouse=True)
+def clear_tickets_cache():
+    # La caché es global al proceso: vaciarla para que cada test parta de cero.
+    tickets_cache.clear()
+    yield
+    tickets_cache.clear()
 
 
 # Fixtures de datos de ejemplo
@@ -139,6 +179,38 @@ async def multiple_tickets(test_session: AsyncSession) -> list[Ticket]:
     return tickets
 
 
+# Fixtures de mocks
+
+class FakeTicketRepo:
+    # Doble de TicketRepository: un AsyncMock por método, sin la introspección
+    # que hace Mock(spec=...) en cada construcción.
+    # Un atributo que no exista sigue lanzando AttributeError.
+    def __init__(self):
+        self.pool = None
+        self.create = AsyncMock()
+        self.create_many = AsyncMock()
+        self.get_by_id = AsyncMock()
+        self.get_by_id_fast = AsyncMock()
+        self.get_all = AsyncMock()
+        self.get_all_dicts = AsyncMock()
+        self.update = AsyncMock()
+        self.update_by_id = AsyncMock()
+        self.delete = AsyncMock()
+        self.delete_by_id = AsyncMock()
+
+
+@pytest.fixture(scope="session")
+def repo_factory():
+    # Fábrica de repositorios falsos, construida una sola vez por sesión.
+    # Cada override fija el return_value del método: repo_factory(get_by_id=ticket).
+    def _make(**overrides) -> FakeTicketRepo:
+        repo = FakeTicketRepo()
+        for method, return_value in overrides.items():
+            getattr(repo, method).return_value = return_value
+        return repo
+    return _make
+
+
 # Configuración adicional de pytest
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,56 @@
+"""
+Tests para la caché en memoria con TTL.
+"""
+
+import pytest
+from src.cache import TTLCache
+
+
+class TestTTLCache:
+    # Tests para TTLCache
+    
+    def test_get_returns_stored_value(self):
+        # Test: Un valor guardado se recupera antes de expirar
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+        
+        assert cache.get("key") == "value"
+    
+    def test_get_missing_key_returns_none(self):
+        # Test: Una clave inexistente devuelve None
+        cache = TTLCache(ttl=60)
+        
+        assert cache.get("missing") is None
+    
+    def test_expired_entry_returns_none(self, monkeypatch):
+        # Test: Una entrada expirada ya no se devuelve
+        now = 1000.0
+        monkeypatch.setattr("src.cache.time.monotonic", lambda: now)
+        cache = TTLCache(ttl=30)
+        cache.set("key", "value")
+        
+        now += 31
+        
+        assert cache.get("key") is None
+    
+    def test_maxsize_evicts_oldest(self):
+        # Test: Al superar maxsize se descarta la entrada más antigua
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+    
+    def test_clear_removes_all_entries(self):
+        # Test: clear invalida todas las entradas
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.clear()
+        
+        assert cache.get("a") is None
+        assert cache.get("b") is None
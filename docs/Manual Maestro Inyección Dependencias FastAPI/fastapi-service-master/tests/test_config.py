@@ -4,7 +4,8 @@ Prueba que las dependencias se inyecten correctamente.
 """
 
 import pytest
-from src.config import get_settings, Settings
+from pydantic import ValidationError
+from src.config import SETTINGS, get_settings, Settings
 
 
 class TestConfiguration:
@@ -16,12 +17,13 @@ class TestConfiguration:
         assert isinstance(settings, Settings)
     
     def test_get_settings_is_cached(self):
-        # Test: get_settings usa caché (lru_cache)
+        # Test: get_settings devuelve siempre la instancia de módulo (SETTINGS)
         settings1 = get_settings()
         settings2 = get_settings()
         
         # Debe ser la misma instancia (mismo objeto en memoria)
         assert settings1 is settings2
+        assert settings1 is SETTINGS
     
     def test_settings_has_required_fields(self):
         # Test: Settings tiene todos los campos requeridos
@@ -43,3 +45,32 @@ class TestConfiguration:
         assert settings.VERSION == "1.0.0"
         assert settings.ALGORITHM == "HS256"
         assert settings.ACCESS_TOKEN_EXPIRE_MINUTES == 30
+    
+    def test_settings_pool_defaults(self):
+        # Test: Valores por defecto del pool de conexiones
+        settings = get_settings()
+        
+        assert settings.DB_POOL_SIZE == 5
+        assert settings.DB_MAX_OVERFLOW == 5
+        assert settings.DB_POOL_TIMEOUT == 30
+        assert settings.DB_POOL_RECYCLE == 3600
+        assert settings.PG_FAST_POOL_MAX == 5
+    
+    def test_settings_pool_defaults_fit_four_workers(self):
+        # Test: Con 4 workers los valores por defecto caben en max_connections
+        settings = Settings(DATABASE_URL="postgresql+asyncpg://u:p@localhost/db", SECRET_KEY="x", UVICORN_WORKERS=4)
+        
+        assert settings.UVICORN_WORKERS * (
+            settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW + settings.PG_FAST_POOL_MAX
+        ) <= settings.DB_MAX_CONNECTIONS
+    
+    def test_settings_rejects_pools_over_connection_budget(self):
+        # Test: Pools que superan DB_MAX_CONNECTIONS con los workers configurados fallan al arrancar
+        with pytest.raises(ValidationError, match="DB_MAX_CONNECTIONS"):
+            Settings(
+                DATABASE_URL="postgresql+asyncpg://u:p@localhost/db",
+                SECRET_KEY="x",
+                UVICORN_WORKERS=4,
+                DB_POOL_SIZE=20,
+                DB_MAX_OVERFLOW=40
+            )
@@ -46,6 +46,25 @@ class TestTicketEndpoints:
         assert data["priority"] == 5  # Auto-asignado
         assert "CRITICAL" in data["title"]
     
+    @pytest.mark.asyncio
+    async def test_create_tickets_bulk(self, client: AsyncClient):
+        # Test: POST /tickets/bulk - Crear varios tickets en una petición
+        # Arrange
+        tickets_data = [
+            {"title": "URGENTE: Payment down", "description": "Desc 1", "priority": 1},
+            {"title": "Update docs", "description": "Desc 2", "priority": 2},
+        ]
+        
+        # Act
+        response = await client.post("/tickets/bulk", json=tickets_data)
+        
+        # Assert
+        assert response.status_code == 201
+        data = response.json()
+        assert len(data) == 2
+        assert all("id" in ticket for ticket in data)
+        assert [ticket["priority"] for ticket in data] == [5, 2]
+    
     @pytest.mark.asyncio
     async def test_create_ticket_validation_error(self, client: AsyncClient):
         # Test: Crear ticket con datos inválidos - validación Pydantic
@@ -77,6 +96,22 @@ class TestTicketEndpoints:
         assert data["id"] == ticket_id
         assert data["title"] == sample_ticket_data["title"]
     
+    @pytest.mark.asyncio
+    async def test_get_ticket_cache_invalidated_on_update(self, client: AsyncClient, sample_ticket_data):
+        # Test: Una lectura cacheada se invalida tras actualizar el ticket
+        # Arrange
+        create_response = await client.post("/tickets/", json=sample_ticket_data)
+        ticket_id = create_response.json()["id"]
+        await client.get(f"/tickets/{ticket_id}")  # Rellena la caché
+        
+        # Act
+        await client.put(f"/tickets/{ticket_id}", json={"title": "Updated Title"})
+        response = await client.get(f"/tickets/{ticket_id}")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["title"] == "Updated Title"
+    
     @pytest.mark.asyncio
     async def test_get_ticket_not_found(self, client: AsyncClient):
         # Test: GET /tickets/{id} con ID inexistente - 404
@@ -133,21 +168,25 @@ class TestTicketEndpoints:
             })
         
         # Act - Primera página (2 items)
-        response1 = await client.get("/tickets/?skip=0&limit=2")
-        # Segunda página (2 items)
-        response2 = await client.get("/tickets/?skip=2&limit=2")
+        response1 = await client.get("/tickets/?limit=2")
+        # Segunda página (2 items), usando el cursor devuelto
+        cursor1 = response1.headers["X-Next-Cursor"]
+        response2 = await client.get(f"/tickets/?after_id={cursor1}&limit=2")
         # Tercera página (1 item)
-        response3 = await client.get("/tickets/?skip=4&limit=2")
+        cursor2 = response2.headers["X-Next-Cursor"]
+        response3 = await client.get(f"/tickets/?after_id={cursor2}&limit=2")
         
         # Assert
         assert response1.status_code == 200
         assert len(response1.json()) == 2
+        assert cursor1 == str(response1.json()[-1]["id"])
         
         assert response2.status_code == 200
         assert len(response2.json()) == 2
         
         assert response3.status_code == 200
         assert len(response3.json()) == 1
+        assert "X-Next-Cursor" not in response3.headers  # Última página
     
     @pytest.mark.asyncio
     async def test_update_ticket(self, client: AsyncClient, sample_ticket_data):
@@ -192,6 +231,20 @@ class TestTicketEndpoints:
         assert data["title"] == original_title  # No cambió
         assert data["description"] == sample_ticket_data["description"]  # No cambió
     
+    @pytest.mark.asyncio
+    async def test_update_ticket_same_values(self, client: AsyncClient, sample_ticket_data):
+        # Test: Reenviar los valores actuales devuelve el ticket sin cambios
+        # Arrange
+        create_response = await client.post("/tickets/", json=sample_ticket_data)
+        ticket_id = create_response.json()["id"]
+        
+        # Act
+        response = await client.put(f"/tickets/{ticket_id}", json={"title": sample_ticket_data["title"]})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == create_response.json()
+    
     @pytest.mark.asyncio
     async def test_update_ticket_not_found(self, client: AsyncClient):
         # Test: Actualizar ticket inexistente - 404
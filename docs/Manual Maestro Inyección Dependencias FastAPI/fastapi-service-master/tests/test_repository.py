@@ -28,6 +28,24 @@ class TestTicketRepository:
         assert created_ticket.priority == sample_ticket_data["priority"]
         assert created_ticket.is_completed is False
     
+    @pytest.mark.asyncio
+    async def test_create_many(self, test_session: AsyncSession):
+        # Test: Crear varios tickets con un único commit
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        tickets = [
+            Ticket(title=f"Ticket {i}", description=f"Desc {i}", priority=1)
+            for i in range(3)
+        ]
+        
+        # Act
+        created = await repo.create_many(tickets)
+        
+        # Assert
+        assert len(created) == 3
+        assert all(t.id is not None for t in created)
+        assert len(await repo.get_all()) == 3
+    
     @pytest.mark.asyncio
     async def test_get_by_id_existing(self, test_session: AsyncSession, created_ticket):
         # Test: Obtener un ticket existente por ID
@@ -55,6 +73,19 @@ class TestTicketRepository:
         # Assert
         assert found_ticket is None
     
+    @pytest.mark.asyncio
+    async def test_get_by_id_fast_without_pool(self, test_session: AsyncSession, created_ticket):
+        # Test: Sin pool asyncpg, get_by_id_fast recurre a la sesión del ORM
+        # Arrange
+        repo = TicketRepository(session=test_session, pool=None)
+        
+        # Act
+        found_ticket = await repo.get_by_id_fast(created_ticket.id)
+        
+        # Assert
+        assert found_ticket is not None
+        assert found_ticket.id == created_ticket.id
+    
     @pytest.mark.asyncio
     async def test_get_all_tickets(self, test_session: AsyncSession, multiple_tickets):
         # Test: Obtener todos los tickets
@@ -62,12 +93,26 @@ class TestTicketRepository:
         repo = TicketRepository(session=test_session)
         
         # Act
-        tickets = await repo.get_all(skip=0, limit=100)
+        tickets = await repo.get_all(limit=100)
         
         # Assert
         assert len(tickets) == 3
         assert all(isinstance(t, Ticket) for t in tickets)
     
+    @pytest.mark.asyncio
+    async def test_get_all_dicts(self, test_session: AsyncSession, multiple_tickets):
+        # Test: Obtener tickets como filas planas (mappings)
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        
+        # Act
+        rows = await repo.get_all_dicts(limit=100)
+        
+        # Assert
+        assert len(rows) == 3
+        assert set(rows[0].keys()) == {"id", "title", "description", "is_completed", "priority"}
+        assert not any(isinstance(row, Ticket) for row in rows)
+    
     @pytest.mark.asyncio
     async def test_get_all_with_pagination(self, test_session: AsyncSession, multiple_tickets):
         # Test: Obtener tickets con paginación
@@ -75,12 +120,13 @@ class TestTicketRepository:
         repo = TicketRepository(session=test_session)
         
         # Act
-        first_page = await repo.get_all(skip=0, limit=2)
-        second_page = await repo.get_all(skip=2, limit=2)
+        first_page = await repo.get_all(limit=2)
+        second_page = await repo.get_all(after_id=first_page[-1].id, limit=2)
         
         # Assert
         assert len(first_page) == 2
         assert len(second_page) == 1
+        assert second_page[0].id > first_page[-1].id
     
     @pytest.mark.asyncio
     async def test_update_ticket(self, test_session: AsyncSession, created_ticket):
@@ -102,6 +148,50 @@ class TestTicketRepository:
         assert fetched.title == "Updated Title"
         assert fetched.is_completed is True
     
+    @pytest.mark.asyncio
+    async def test_update_by_id(self, test_session: AsyncSession, created_ticket):
+        # Test: Actualizar por ID con UPDATE ... RETURNING
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        
+        # Act
+        updated_ticket = await repo.update_by_id(created_ticket.id, {"title": "Updated Title", "is_completed": True})
+        
+        # Assert
+        assert updated_ticket.id == created_ticket.id
+        assert updated_ticket.title == "Updated Title"
+        assert updated_ticket.is_completed is True
+        assert updated_ticket.description == created_ticket.description
+    
+    @pytest.mark.asyncio
+    async def test_update_by_id_same_values(self, test_session: AsyncSession, created_ticket):
+        # Test: Actualizar por ID con los valores actuales no toca la fila y devuelve None
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        
+        # Act
+        updated_ticket = await repo.update_by_id(created_ticket.id, {
+            "title": created_ticket.title,
+            "priority": created_ticket.priority
+        })
+        
+        # Assert
+        assert updated_ticket is None
+        fetched = await repo.get_by_id(created_ticket.id)
+        assert fetched.title == created_ticket.title
+    
+    @pytest.mark.asyncio
+    async def test_update_by_id_non_existing(self, test_session: AsyncSession):
+        # Test: Actualizar por ID un ticket que no existe devuelve None
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        
+        # Act
+        updated_ticket = await repo.update_by_id(99999, {"title": "Updated Title"})
+        
+        # Assert
+        assert updated_ticket is None
+    
     @pytest.mark.asyncio
     async def test_delete_ticket(self, test_session: AsyncSession, created_ticket):
         # Test: Eliminar un ticket
@@ -115,3 +205,19 @@ class TestTicketRepository:
         # Assert
         deleted_ticket = await repo.get_by_id(ticket_id)
         assert deleted_ticket is None
+    
+    @pytest.mark.asyncio
+    async def test_delete_by_id(self, test_session: AsyncSession, created_ticket):
+        # Test: Eliminar por ID con DELETE ... RETURNING id
+        # Arrange
+        repo = TicketRepository(session=test_session)
+        ticket_id = created_ticket.id
+        
+        # Act
+        deleted_id = await repo.delete_by_id(ticket_id)
+        missing_id = await repo.delete_by_id(ticket_id)
+        
+        # Assert
+        assert deleted_id == ticket_id
+        assert missing_id is None
+        assert await repo.get_by_id(ticket_id) is None
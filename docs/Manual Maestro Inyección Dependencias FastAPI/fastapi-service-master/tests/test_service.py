@@ -1,25 +1,38 @@
 # Tests para la capa de Service.
 # Prueba la lógica de negocio de la aplicación.
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock
 from fastapi import HTTPException
 
+from src.cache import tickets_cache
 from src.tickets.models import Ticket
 from src.tickets.schemas import TicketCreate, TicketUpdate
-from src.tickets.service import TicketService
-from src.tickets.repository import TicketRepository
+from src.tickets.service import _BATCH_READ_CONCURRENCY, TicketService
 
 
+# Payloads constantes: se validan una sola vez al importar el módulo.
+# Los tests no los modifican; para una variante se usa model_copy(update=...)
+_CRITICAL_CREATE = TicketCreate(
+    title="CRITICAL: Server down",
+    description="Production server is offline",
+    priority=2  # Esto será overrideado
+)
+_URGENT_CREATE = _CRITICAL_CREATE.model_copy(update={
+    "title": "URGENTE: Fix payment bug",
+    "priority": 1,
+})
+_UPDATE_TITLE = TicketUpdate(title="New Title", is_completed=True)
+
 class TestTicketService:
     # Tests para TicketService
     
     @pytest.mark.asyncio
-    async def test_create_ticket_normal_priority(self, sample_ticket_data):
+    async def test_create_ticket_normal_priority(self, repo_factory, sample_ticket_data):
         # Test: Crear ticket con prioridad normal
         # Arrange
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.create = AsyncMock(return_value=Ticket(
+        mock_repo = repo_factory(create=Ticket(
             id=1,
             **sample_ticket_data
         ))
@@ -36,23 +49,19 @@ class TestTicketService:
         mock_repo.create.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_create_ticket_critical_auto_priority(self):
-        # Test: Crear ticket con palabra CRITICAL - prioridad automática a 5
+    @pytest.mark.parametrize("ticket_data", [_CRITICAL_CREATE, _URGENT_CREATE], ids=["critical", "urgente"])
+    async def test_create_ticket_keyword_auto_priority(self, repo_factory, ticket_data):
+        # Test: Crear ticket con palabra CRITICAL/URGENTE - prioridad automática a 5
         # Arrange
-        mock_repo = Mock(spec=TicketRepository)
+        mock_repo = repo_factory()
         
         async def mock_create(ticket):
             ticket.id = 1
             return ticket
         
-        mock_repo.create = AsyncMock(side_effect=mock_create)
+        mock_repo.create.side_effect = mock_create
         
         service = TicketService(repo=mock_repo)
-        ticket_data = TicketCreate(
-            title="CRITICAL: Server down",
-            description="Production server is offline",
-            priority=2  # Esto será overrideado
-        )
         
         # Act
         result = await service.create_ticket(ticket_data)
@@ -66,32 +75,27 @@ class TestTicketService:
         assert call_args.priority == 5
     
     @pytest.mark.asyncio
-    async def test_create_ticket_urgente_auto_priority(self):
-        # Test: Crear ticket con palabra URGENTE - prioridad automática a 5
+    async def test_create_many_applies_priority_rule(self, repo_factory):
+        # Test: La creación masiva aplica la regla CRITICAL/URGENTE a cada ticket
         # Arrange
-        mock_repo = Mock(spec=TicketRepository)
-        
-        async def mock_create(ticket):
-            ticket.id = 1
-            return ticket
-        
-        mock_repo.create = AsyncMock(side_effect=mock_create)
+        mock_repo = repo_factory()
+        mock_repo.create_many.side_effect = lambda tickets: tickets
         
         service = TicketService(repo=mock_repo)
-        ticket_data = TicketCreate(
-            title="URGENTE: Fix payment bug",
-            description="Customers can't pay",
-            priority=1
-        )
+        tickets_in = [
+            _CRITICAL_CREATE,
+            _CRITICAL_CREATE.model_copy(update={"title": "Update docs"}),
+        ]
         
         # Act
-        result = await service.create_ticket(ticket_data)
+        result = await service.create_many(tickets_in)
         
         # Assert
-        assert result.priority == 5
+        assert [t.priority for t in result] == [5, 2]
+        mock_repo.create_many.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_get_ticket_existing(self):
+    async def test_get_ticket_existing(self, repo_factory):
         # Test: Obtener un ticket existente
         # Arrange
         ticket_id = 1
@@ -102,8 +106,7 @@ class TestTicketService:
             priority=3
         )
         
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=mock_ticket)
+        mock_repo = repo_factory(get_by_id_fast=mock_ticket)
         
         service = TicketService(repo=mock_repo)
         
@@ -113,15 +116,14 @@ class TestTicketService:
         # Assert
         assert result.id == ticket_id
         assert result.title == "Test"
-        mock_repo.get_by_id.assert_called_once_with(ticket_id)
+        mock_repo.get_by_id_fast.assert_called_once_with(ticket_id)
     
     @pytest.mark.asyncio
-    async def test_get_ticket_not_found(self):
+    async def test_get_ticket_not_found(self, repo_factory):
         # Test: Intentar obtener un ticket que no existe - debe lanzar 404
         # Arrange
         ticket_id = 99999
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=None)
+        mock_repo = repo_factory(get_by_id_fast=None)
         
         service = TicketService(repo=mock_repo)
         
@@ -133,91 +135,203 @@ class TestTicketService:
         assert "not found" in str(exc_info.value.detail).lower()
     
     @pytest.mark.asyncio
-    async def test_get_all_tickets(self):
+    async def test_get_tickets_by_ids(self, repo_factory):
+        # Test: Lecturas en paralelo, en el mismo orden que los IDs y None si no existe
+        # Arrange
+        rows = {
+            1: {"id": 1, "title": "T1", "description": "D1", "is_completed": False, "priority": 1},
+            2: {"id": 2, "title": "T2", "description": "D2", "is_completed": True, "priority": 2},
+        }
+        mock_pool = Mock()
+        mock_pool.fetchrow = AsyncMock(side_effect=lambda query, ticket_id: rows.get(ticket_id))
+        
+        mock_repo = repo_factory()
+        mock_repo.pool = mock_pool
+        
+        service = TicketService(repo=mock_repo)
+        
+        # Act
+        result = await service.get_tickets_by_ids([2, 99999, 1])
+        
+        # Assert
+        assert [ticket.id if ticket else None for ticket in result] == [2, None, 1]
+        assert mock_pool.fetchrow.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_tickets_by_ids_uses_cache(self, repo_factory):
+        # Test: Los IDs cacheados no consultan la DB y los leídos quedan cacheados
+        # Arrange
+        cached_ticket = Ticket(id=3, title="Cached", description="From cache", priority=1)
+        tickets_cache.set(("ticket", 3), cached_ticket)
+        
+        mock_pool = Mock()
+        mock_pool.fetchrow = AsyncMock(return_value={
+            "id": 1, "title": "T1", "description": "D1", "is_completed": False, "priority": 1
+        })
+        
+        mock_repo = repo_factory()
+        mock_repo.pool = mock_pool
+        
+        service = TicketService(repo=mock_repo)
+        
+        # Act
+        result = await service.get_tickets_by_ids([3, 1])
+        
+        # Assert
+        assert result[0] is cached_ticket
+        assert result[1].id == 1
+        mock_pool.fetchrow.assert_awaited_once()
+        assert tickets_cache.get(("ticket", 1)) is result[1]
+    
+    @pytest.mark.asyncio
+    async def test_get_tickets_by_ids_limits_concurrency(self, repo_factory):
+        # Test: Muchos IDs no ocupan más conexiones a la vez que el límite
+        # Arrange
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def slow_fetchrow(query, ticket_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return None
+        
+        mock_pool = Mock()
+        mock_pool.fetchrow = AsyncMock(side_effect=slow_fetchrow)
+        
+        mock_repo = repo_factory()
+        mock_repo.pool = mock_pool
+        
+        service = TicketService(repo=mock_repo)
+        
+        # Act
+        result = await service.get_tickets_by_ids(list(range(1, 51)))
+        
+        # Assert
+        assert result == [None] * 50
+        assert max_in_flight <= _BATCH_READ_CONCURRENCY
+    
+    @pytest.mark.asyncio
+    async def test_get_all_tickets(self, repo_factory):
         # Test: Obtener todos los tickets con paginación
         # Arrange
-        mock_tickets = [
-            Ticket(id=1, title="T1", description="D1", priority=1),
-            Ticket(id=2, title="T2", description="D2", priority=2),
+        mock_rows = [
+            {"id": 1, "title": "T1", "description": "D1", "is_completed": False, "priority": 1},
+            {"id": 2, "title": "T2", "description": "D2", "is_completed": True, "priority": 2},
         ]
         
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_all = AsyncMock(return_value=mock_tickets)
+        mock_repo = repo_factory(get_all_dicts=mock_rows)
         
         service = TicketService(repo=mock_repo)
         
         # Act
-        result = await service.get_all_tickets(skip=0, limit=10)
+        result = await service.get_all_tickets(after_id=None, limit=10)
         
         # Assert
         assert len(result) == 2
-        mock_repo.get_all.assert_called_once_with(skip=0, limit=10)
+        assert result[1].is_completed is True
+        mock_repo.get_all_dicts.assert_called_once_with(after_id=None, limit=10)
     
     @pytest.mark.asyncio
-    async def test_update_ticket(self):
+    async def test_update_ticket(self, repo_factory):
         # Test: Actualizar un ticket existente
         # Arrange
         ticket_id = 1
-        existing_ticket = Ticket(
+        updated_ticket = Ticket(
             id=ticket_id,
-            title="Old Title",
+            title="New Title",
             description="Old desc",
             priority=2,
-            is_completed=False
+            is_completed=True
         )
         
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=existing_ticket)
-        mock_repo.update = AsyncMock(return_value=existing_ticket)
+        mock_repo = repo_factory(update_by_id=updated_ticket)
         
         service = TicketService(repo=mock_repo)
         
-        update_data = TicketUpdate(
-            title="New Title",
-            is_completed=True
-        )
-        
         # Act
-        result = await service.update_ticket(ticket_id, update_data)
+        result = await service.update_ticket(ticket_id, _UPDATE_TITLE)
         
         # Assert
         assert result.title == "New Title"
         assert result.is_completed is True
         assert result.description == "Old desc"  # No cambió
-        mock_repo.update.assert_called_once()
+        # Un solo viaje: solo los campos enviados, sin leer el ticket antes
+        mock_repo.update_by_id.assert_called_once_with(ticket_id, {"title": "New Title", "is_completed": True})
+        mock_repo.get_by_id.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_update_ticket_not_found(self):
+    async def test_update_ticket_empty_payload_skips_write(self, repo_factory):
+        # Test: Un PUT sin campos no escribe en la base de datos
+        # Arrange
+        existing_ticket = Ticket(
+            id=1,
+            title="Same Title",
+            description="Same desc",
+            priority=2,
+            is_completed=False
+        )
+        
+        mock_repo = repo_factory(get_by_id_fast=existing_ticket)
+        
+        service = TicketService(repo=mock_repo)
+        # Act
+        result = await service.update_ticket(1, TicketUpdate())
+        
+        # Assert
+        assert result is existing_ticket
+        mock_repo.update_by_id.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_update_ticket_not_found(self, repo_factory):
         # Test: Intentar actualizar un ticket que no existe
         # Arrange
         ticket_id = 99999
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=None)
+        mock_repo = repo_factory(update_by_id=None, get_by_id_fast=None)
         
         service = TicketService(repo=mock_repo)
-        update_data = TicketUpdate(title="New Title")
         
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await service.update_ticket(ticket_id, update_data)
+            await service.update_ticket(ticket_id, _UPDATE_TITLE)
         
         assert exc_info.value.status_code == 404
     
     @pytest.mark.asyncio
-    async def test_delete_ticket(self):
-        # Test: Eliminar un ticket existente
+    async def test_update_ticket_same_values_keeps_cache(self, repo_factory):
+        # Test: Un PUT con los valores actuales no invalida la caché y devuelve el ticket
         # Arrange
-        ticket_id = 1
         existing_ticket = Ticket(
-            id=ticket_id,
-            title="To Delete",
-            description="Will be deleted",
-            priority=1
+            id=1,
+            title="New Title",
+            description="Same desc",
+            priority=2,
+            is_completed=True
         )
+        other_ticket = Ticket(id=2, title="Other", description="Other desc", priority=1)
+        tickets_cache.set(("ticket", 2), other_ticket)
+        
+        # update_by_id devuelve None: ninguna columna era distinta
+        mock_repo = repo_factory(update_by_id=None, get_by_id_fast=existing_ticket)
         
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=existing_ticket)
-        mock_repo.delete = AsyncMock(return_value=None)
+        service = TicketService(repo=mock_repo)
+        
+        # Act
+        result = await service.update_ticket(1, _UPDATE_TITLE)
+        
+        # Assert
+        assert result is existing_ticket
+        mock_repo.update_by_id.assert_called_once_with(1, {"title": "New Title", "is_completed": True})
+        assert tickets_cache.get(("ticket", 2)) is other_ticket
+    
+    @pytest.mark.asyncio
+    async def test_delete_ticket(self, repo_factory):
+        # Test: Eliminar un ticket existente
+        # Arrange
+        ticket_id = 1
+        mock_repo = repo_factory(delete_by_id=ticket_id)
         
         service = TicketService(repo=mock_repo)
         
@@ -225,15 +339,14 @@ class TestTicketService:
         await service.delete_ticket(ticket_id)
         
         # Assert
-        mock_repo.delete.assert_called_once_with(existing_ticket)
+        mock_repo.delete_by_id.assert_called_once_with(ticket_id)
     
     @pytest.mark.asyncio
-    async def test_delete_ticket_not_found(self):
+    async def test_delete_ticket_not_found(self, repo_factory):
         # Test: Intentar eliminar un ticket que no existe
         # Arrange
         ticket_id = 99999
-        mock_repo = Mock(spec=TicketRepository)
-        mock_repo.get_by_id = AsyncMock(return_value=None)
+        mock_repo = repo_factory(delete_by_id=None)
         
         service = TicketService(repo=mock_repo)
         
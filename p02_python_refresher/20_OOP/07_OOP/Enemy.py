@@ -1,4 +1,10 @@
+import logging
+
+LOG = logging.getLogger("battle.enemy")
+
 class Enemy:
+    __slots__ = ("__type_of_enemy", "health_points", "attack_damage")
+
     def __init__(self, type_of_enemy, health_points, attack_damage):
         self.__type_of_enemy = type_of_enemy
         self.health_points = health_points
@@ -11,10 +17,10 @@ class Enemy:
         print(f"{self.__type_of_enemy} moves closer to you")
 
     def attack(self):
-        print(f"{self.__type_of_enemy} attacks for {self.attack_damage} damage")  
+        LOG.debug("%s attacks for %s damage", self.__type_of_enemy, self.attack_damage)  
 
     def special_attack(self):
-        print('Enemy has no special attack.')
+        LOG.debug('Enemy has no special attack.')
         
     def get_type_of_enemy(self):
         return self.__type_of_enemy
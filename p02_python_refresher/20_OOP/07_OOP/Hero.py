@@ -1,6 +1,11 @@
 from Weapon import *
+import logging
+
+LOG = logging.getLogger("battle.hero")
 
 class Hero:
+    __slots__ = ("health_points", "attack_damage", "is_weapon_equipped", "weapon")
+
     def __init__(self, health_points, attack_damage):
         self.health_points = health_points
         self.attack_damage = attack_damage
@@ -13,4 +18,4 @@ class Hero:
             self.is_weapon_equipped = True
     
     def attack(self):
-        print(f"Hero attacks for {self.attack_damage} damage")
\ No newline at end of file
+        LOG.debug("Hero attacks for %s damage", self.attack_damage)
\ No newline at end of file
@@ -1,7 +1,12 @@
 from Enemy import *
+import logging
 import random
 
+LOG = logging.getLogger("battle.ogre")
+
 class Ogre(Enemy):
+    __slots__ = ()
+
     def __init__(self, health_points, attack_damage):
         super().__init__(type_of_enemy="Ogre", health_points=health_points, attack_damage=attack_damage)
 
@@ -12,5 +17,5 @@ class Ogre(Enemy):
         did_special_attack_work = random.random() < 0.20
         if did_special_attack_work:
             self.attack_damage += 4
-            print("Ogre gets angry and its attack has increased by 4!")
+            LOG.debug("Ogre gets angry and its attack has increased by 4!")
     
\ No newline at end of file
@@ -1,4 +1,6 @@
 class Weapon:
+    __slots__ = ("weapon_type", "attack_increase")
+
     def __init__(self, weapon_type, attack_increase):
         self.weapon_type = weapon_type
         self.attack_increase = attack_increase
\ No newline at end of file
@@ -1,6 +1,12 @@
 from Enemy import *
+import logging
 import random
+
+LOG = logging.getLogger("battle.zombie")
+
 class Zombie(Enemy):
+    __slots__ = ()
+
     def __init__(self, health_points, attack_damage):
         super().__init__(type_of_enemy="Zombie", health_points=health_points, attack_damage=attack_damage)
 
@@ -14,4 +20,4 @@ class Zombie(Enemy):
         did_special_attack_work = random.random() < 0.50
         if did_special_attack_work:
             self.health_points += 2
-            print("Zombie generated 2 HP")
\ No newline at end of file
+            LOG.debug("Zombie generated 2 HP")
\ No newline at end of file
@@ -2,27 +2,62 @@ from Zombie import *
 from Ogre import *
 from Enemy import *
 from Hero import *
+import logging
 
-def hero_battle(hero: Hero, enemy: Enemy):
+# Todos los loggers del combate cuelgan de "battle" (battle.enemy, battle.hero, ...)
+# Tiene su propio handler y no propaga, así no toca el logging del resto del programa
+LOG = logging.getLogger("battle")
+LOG.setLevel(logging.WARNING)
+LOG.propagate = False
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter("%(message)s"))
+LOG.addHandler(_handler)
 
+# Los mensajes del combate van por logging en lugar de print: con verbose=False
+# el nivel de "battle" queda en WARNING y los LOG.debug se descartan sin formatear nada
+def hero_battle(hero: Hero, enemy: Enemy, verbose=False):
+    previous_level = LOG.level
+    LOG.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    try:
+        return _fight(hero, enemy)
+    finally:
+        LOG.setLevel(previous_level)
+
+def _fight(hero: Hero, enemy: Enemy):
     while hero.health_points > 0 and enemy.health_points > 0:
-        print("-------------")
+        LOG.debug("-------------")
 
         enemy.special_attack()
-        print(f"Hero: {hero.health_points} HP left")
-        print(f"{enemy.get_type_of_enemy()}: {enemy.health_points} HP left")
+        LOG.debug("Hero: %s HP left", hero.health_points)
+        LOG.debug("%s: %s HP left", enemy.get_type_of_enemy(), enemy.health_points)
 
         enemy.attack()
         hero.health_points -= enemy.attack_damage
         hero.attack()
         enemy.health_points -= hero.attack_damage
 
-    print("-------------")
+    LOG.debug("-------------")
 
-    if hero.health_points > 0:
-        print(f"Hero wins!")
+    hero_wins = hero.health_points > 0
+    if hero_wins:
+        LOG.debug("Hero wins!")
     else:
-        print(f"{enemy.get_type_of_enemy()} wins!")
+        LOG.debug("%s wins!", enemy.get_type_of_enemy())
+    return hero_wins
+
+# Versión por lotes (sin ataques especiales): resuelve N batallas a la vez.
+# Cada turno el enemigo ataca primero, así que en empate gana el enemigo.
+# Necesita NumPy (pip install numpy); se importa aquí para que el resto
+# de la lección funcione sin él.
+def simulate_battles(hero_hp, hero_dmg, enemy_hp, enemy_dmg):
+    import numpy as np
+
+    hero_hp, hero_dmg = np.asarray(hero_hp), np.asarray(hero_dmg)
+    enemy_hp, enemy_dmg = np.asarray(enemy_hp), np.asarray(enemy_dmg)
+    hero_turns = np.ceil(enemy_hp / hero_dmg)
+    enemy_turns = np.ceil(hero_hp / enemy_dmg)
+    hero_wins = hero_turns < enemy_turns
+    return hero_wins
 
         
 zombie = Zombie(10, 1)
@@ -30,4 +65,15 @@ hero = Hero(10, 1)
 weapon = Weapon('Sword', 5)
 hero.weapon = weapon
 hero.equip_weapon()
-hero_battle(hero, zombie)
+hero_battle(hero, zombie, verbose=True)
+
+try:
+    hero_wins = simulate_battles(
+        hero_hp=[10, 10, 20],
+        hero_dmg=[6, 1, 3],
+        enemy_hp=[10, 30, 15],
+        enemy_dmg=[1, 2, 5],
+    )
+    print(f"Hero wins {hero_wins.sum()} of {hero_wins.size} battles")
+except ImportError:
+    print("simulate_battles needs NumPy: pip install numpy")
\ No newline at end of file
@@ -1,6 +1,8 @@
 from fastapi import Body, FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+# ORJSONResponse serializa las listas de libros con orjson (requiere: pip install orjson)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/api-endpoint")
 async def first_api():
@@ -14,75 +16,91 @@ async def first_api():
 # La documentación automática estará disponible en: 
 # http://127.0.0.1:8000/docs
 
-BOOKS = [
+# Libros indexados por título en casefold: leer, actualizar y eliminar
+# un libro es un único acceso al diccionario
+BOOKS: dict[str, dict] = {book['Title'].casefold(): book for book in [
     {'Title': 'Harry Potter', 'Author': 'Author One', 'Pages': 150, 'Rating': 4.5, 'Category': 'Fiction'},
     {'Title': 'Title Two', 'Author': 'Author Two', 'Pages': 200, 'Rating': 4.0, 'Category': 'Non-Fiction'},
     {'Title': 'Title Three', 'Author': 'Author Three', 'Pages': 300, 'Rating': 4.8, 'Category': 'Science Fiction'},
     {'Title': 'Title Four', 'Author': 'Author Four', 'Pages': 250, 'Rating': 3.9, 'Category': 'Fantasy'},
     {'Title': 'Title Five', 'Author': 'Author Five', 'Pages': 180, 'Rating': 4.2, 'Category': 'Fiction'},
-]
+]}
+
+# Índices en memoria por autor y categoría, con claves en casefold
+# Se construyen una vez y se mantienen al crear/actualizar/eliminar,
+# así cada búsqueda es un acceso a diccionario en lugar de recorrer BOOKS
+BY_AUTHOR: dict[str, list[dict]] = {}
+BY_CATEGORY: dict[str, list[dict]] = {}
+
+def index_book(book: dict):
+    BY_AUTHOR.setdefault(book.get('Author').casefold(), []).append(book)
+    BY_CATEGORY.setdefault(book.get('Category').casefold(), []).append(book)
+
+def unindex_book(book: dict):
+    for index, key in ((BY_AUTHOR, book.get('Author').casefold()), (BY_CATEGORY, book.get('Category').casefold())):
+        books = index[key]
+        books.remove(book)
+        if not books:
+            del index[key]
+
+for book in BOOKS.values():
+    index_book(book)
 
 @app.get("/books")
 async def read_all_books():
-    return BOOKS
+    return list(BOOKS.values())
 
 # Path Paramters
 # http://127.0.0.1:8000/books/HarryPotter
 @app.get("/books/{book_title}")
 async def read_book(book_title: str):
-    for book in BOOKS:
-        if book.get('Title').casefold() == book_title.casefold():
-            return book
+    return BOOKS.get(book_title.casefold())
         
 # Query Parameters
 # http://127.0.0.1:8000/books/?category=Fiction
 @app.get("/books/")
 async def read_category_by_query(category: str):
-    books_to_return = []
-    for book in BOOKS:
-        if book.get('Category').casefold() == category.casefold():
-            books_to_return.append(book)
-    
-    return books_to_return
+    return BY_CATEGORY.get(category.casefold(), [])
 
 # Get all books from a specific author using query parameters
 @app.get("/books/byauthor/")
 async def read_books_by_author_query(author : str):
-    books_to_return = []
-    for book in BOOKS:
-        if book.get("Author").casefold() == author.casefold():
-            books_to_return.append(book)
-    return books_to_return
+    return BY_AUTHOR.get(author.casefold(), [])
 
 # Get all books from a especific author using path parameters and an especific category using query params
-@app.get("/books/{book_author}")
+# Ruta propia: con "/books/{book_author}" coincidía con "/books/{book_title}" y nunca se alcanzaba
+# http://127.0.0.1:8000/books/author/Author One?category=Fiction
+@app.get("/books/author/{book_author}")
 async def read_book_by_author_path_by_category_query(book_author: str, category: str):
-    books_to_return = []
-    for book in BOOKS:
-        print(book)
-        print(book_author)
-        print(category)
-        if book.get("Author").casefold() == book_author.casefold() and book.get("Category").casefold() == category.casefold():
-            books_to_return.append(book)
-    return books_to_return
+    # Normalizar los parámetros una sola vez y recorrer solo los libros del autor
+    category_cf = category.casefold()
+    return [book for book in BY_AUTHOR.get(book_author.casefold(), []) if book.get("Category").casefold() == category_cf]
 
 @app.post("/books/create")  
 async def create_book(new_book=Body()):
-    BOOKS.append(new_book)
+    key = new_book.get('Title').casefold()
+    # Un título repetido reemplaza al libro anterior
+    if key in BOOKS:
+        unindex_book(BOOKS[key])
+    BOOKS[key] = new_book
+    index_book(new_book)
     return {'message':'Book created'}
 
 @app.put("/books/update")
 async def update_book(updated_book=Body()):
-    for i, book in enumerate(BOOKS):
-        if book.get("Title").casefold() == updated_book.get("Title").casefold():
-            BOOKS[i] = updated_book
-            return {'message': 'Book updated'}
-    return {'message': 'Book not found'}
+    key = updated_book.get("Title").casefold()
+    book = BOOKS.get(key)
+    if book is None:
+        return {'message': 'Book not found'}
+    BOOKS[key] = updated_book
+    unindex_book(book)
+    index_book(updated_book)
+    return {'message': 'Book updated'}
 
 @app.delete("/books/delete/{title}")
 async def delete_book(title: str):
-    for i, book in enumerate(BOOKS):
-        if book.get("Title").casefold() == title.casefold():
-            BOOKS.pop(i)
-            return {'message': f'Book {title} deleted'}
-    return {'message': 'Book not found'}
\ No newline at end of file
+    book = BOOKS.pop(title.casefold(), None)
+    if book is None:
+        return {'message': 'Book not found'}
+    unindex_book(book)
+    return {'message': f'Book {title} deleted'}
\ No newline at end of file
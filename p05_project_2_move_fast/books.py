@@ -2,8 +2,10 @@ from typing import Optional
 from fastapi import FastAPI, Path, Query, HTTPException, Body
 from pydantic import BaseModel, Field
 from starlette import status
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+# ORJSONResponse serializa las listas de libros con orjson (requiere: pip install orjson)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Clase interma
 class Book:
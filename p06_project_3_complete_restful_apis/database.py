@@ -1,22 +1,51 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./data/mi_base.db'
+# aiosqlite: driver asíncrono, las consultas no bloquean el event loop
+SQLALCHEMY_DATABASE_URL = 'sqlite+aiosqlite:///./data/mi_base.db'
 
 # El motor
 # check_same_thread=False es OBLIGATORIO en SQLite con FastAPI
 # porque SQLite por defecto solo permite un hilo, y FastAPI usa varios.
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={'check_same_thread' : False})
+#
+# Pool de conexiones explícito (los valores por defecto, 5 + 10, se agotan con carga concurrente):
+# - pool_size / max_overflow: conexiones persistentes + extra en picos. Son POR PROCESO:
+#   con "uvicorn --workers N" el total es N * (pool_size + max_overflow)
+# - pool_timeout: segundos que una petición espera por una conexión libre antes de fallar
+# - pool_recycle: renueva conexiones con más de una hora de vida
+# - pool_pre_ping: comprueba la conexión antes de entregarla y descarta las muertas
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={'check_same_thread' : False},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=5,
+    pool_recycle=3600,
+    pool_pre_ping=True
+)
 
 # Fabrica de sesiones
-# una fábrica (una clase) que generará sesiones bajo demanda.
-SessionLocal = sessionmaker(autocommit = False, autoflush=False, bind=engine)
+# una fábrica (una clase) que generará sesiones asíncronas bajo demanda.
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
 
 # Base declarativa
 # Es una clase de la cual heredarán todos los modelos
 Base = declarative_base()
 
+# Dependencia compartida por todos los routers
+# "async with" cierra la sesión al terminar la petición
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
+
+# Crear las tablas (se llama desde el lifespan de main.py)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
 # Explicacion de cada componente:
 # engine: El conductor del camión (sabe manejar SQLite).
 # SessionLocal: La oficina de contratos (crea instancias temporales para cada petición).
-# Base: El plano maestro (sabe qué forma deben tener los datos).
\ No newline at end of file
+# Base: El plano maestro (sabe qué forma deben tener los datos).
@@ -1,11 +1,18 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import models
-from database import engine
+from database import create_tables, engine
 from routers import auth, todos, admin, users
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Con el motor asíncrono las tablas se crean al arrancar, no al importar
+    await create_tables()
+    yield
+    # Cerrar las conexiones del pool (aiosqlite usa un hilo por conexión)
+    await engine.dispose()
 
-models.Base.metadata.create_all(bind=engine)
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth.router)
 app.include_router(todos.router)
@@ -1,9 +1,10 @@
 from typing import Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, HTTPException, Path
 from starlette import status
 from models import Todos
-from database import SessionLocal
+from database import get_db
 from .auth import get_current_user
 
 router = APIRouter(
@@ -11,31 +12,26 @@ router = APIRouter(
     tags=['admin']
 )
 
-def get_db():
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
-db_dependency = Annotated[Session, Depends(get_db)]
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
 
 @router.get("/todo", status_code=status.HTTP_200_OK)
 async def read_all(user: user_dependency, db: db_dependency):
     if user is None or user.get("user_role") != "admin":
         raise HTTPException(status_code=401, detail="Authentication Failed")
-    return db.query(Todos).all()
+    result = await db.execute(select(Todos))
+    return result.scalars().all()
 
 @router.delete("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_todo(user: user_dependency, db: db_dependency, todo_id: int = Path(gt=0)):
     if user is None or user.get("user_role") != "admin":
         raise HTTPException(status_code=401, detail="Authentication Failed")
 
-    todo_model = db.query(Todos).filter(Todos.id == todo_id).first()
+    result = await db.execute(select(Todos).where(Todos.id == todo_id))
+    todo_model = result.scalars().first()
 
     if todo_model is None:
         raise HTTPException(status_code=404, detail="Todo Not found")
     
-    db.query(Todos).filter(Todos.id == todo_id).delete()
-    db.commit()
+    await db.execute(delete(Todos).where(Todos.id == todo_id))
+    await db.commit()
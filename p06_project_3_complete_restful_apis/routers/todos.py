@@ -1,27 +1,21 @@
 from typing import Annotated
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, HTTPException, Path
 from starlette import status
 from models import Todos
-from database import SessionLocal
+from database import get_db
 from .auth import get_current_user
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Inyeccion de dependencias
-# Session: tipo de datos
+# AsyncSession: tipo de datos
 # Depends(get_db): Llama a get_db() y usa lo que retorna
-# Annotated: Combina el tipo (Session) con la metadata (Depends(get_db))
+# Annotated: Combina el tipo (AsyncSession) con la metadata (Depends(get_db))
 # db_dependency: Alias reutilizable
-db_dependency = Annotated[Session, Depends(get_db)]
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
 
 class TodoRequest(BaseModel):
@@ -35,19 +29,20 @@ async def read_all(user: user_dependency, db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication Failed")
     
-    return db.query(Todos)\
-        .filter(Todos.owner_id == user.get('id'))\
-        .all()
+    result = await db.execute(select(Todos).where(Todos.owner_id == user.get('id')))
+    return result.scalars().all()
 
 @router.get("/todo/{todo_id}", status_code=status.HTTP_200_OK)
 async def read_todo(user: user_dependency, db: db_dependency, todo_id: int = Path(gt=0)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication Failed")
     
-    todo_model = db.query(Todos)\
-        .filter(Todos.id == todo_id)\
-        .filter(Todos.owner_id == user.get("id"))\
-        .first()   
+    result = await db.execute(
+        select(Todos)
+        .where(Todos.id == todo_id)
+        .where(Todos.owner_id == user.get("id"))
+    )
+    todo_model = result.scalars().first()
     
     if todo_model is not None:
         return todo_model
@@ -63,17 +58,19 @@ async def create_todo(user: user_dependency, db: db_dependency, todo_request: To
     todo_model = Todos(**todo_request.model_dump(), owner_id=user.get("id"))
 
     db.add(todo_model)
-    db.commit()
+    await db.commit()
 
 @router.put("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_todo(user: user_dependency, db: db_dependency, todo_request: TodoRequest, todo_id : int = Path(gt=0)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication Failed")
     
-    todo_model = db.query(Todos)\
-        .filter(Todos.id == todo_id)\
-        .filter(Todos.owner_id == user.get("id"))\
-        .first()
+    result = await db.execute(
+        select(Todos)
+        .where(Todos.id == todo_id)
+        .where(Todos.owner_id == user.get("id"))
+    )
+    todo_model = result.scalars().first()
 
     if todo_model is None:
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -84,20 +81,22 @@ async def update_todo(user: user_dependency, db: db_dependency, todo_request: To
     todo_model.complete = todo_request.complete
 
     db.add(todo_model)
-    db.commit()
+    await db.commit()
 
 @router.delete("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_todo(user: user_dependency, db: db_dependency, todo_id : int = Path(gt=0)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authentication Failed")
     
-    todo_model = db.query(Todos)\
-        .filter(Todos.id == todo_id)\
-        .filter(Todos.owner_id == user.get("id"))\
-        .first()
+    result = await db.execute(
+        select(Todos)
+        .where(Todos.id == todo_id)
+        .where(Todos.owner_id == user.get("id"))
+    )
+    todo_model = result.scalars().first()
 
     if todo_model is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    db.query(Todos).filter(Todos.id == todo_id).filter(Todos.owner_id == user.get("id")).delete()
-    db.commit()
\ No newline at end of file
+    await db.execute(delete(Todos).where(Todos.id == todo_id).where(Todos.owner_id == user.get("id")))
+    await db.commit()
\ No newline at end of file
@@ -1,10 +1,11 @@
 from typing import Annotated
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, HTTPException, Path
 from starlette import status
 from models import Users
-from database import SessionLocal
+from database import get_db
 from .auth import get_current_user
 from passlib.context import CryptContext
 
@@ -13,14 +14,7 @@ router = APIRouter(
     tags=['user']
 )
 
-def get_db():
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
-db_dependency = Annotated[Session, Depends(get_db)]
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
 bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
@@ -32,14 +26,16 @@ class UserVerification(BaseModel):
 async def get_user(user: user_dependency, db: db_dependency):
     if user is None:
         raise HTTPException(status_code=401, detail='Authentication Failed')
-    return db.query(Users).filter(Users.id == user.get('id')).first()
+    result = await db.execute(select(Users).where(Users.id == user.get('id')))
+    return result.scalars().first()
 
 @router.put("/password", status_code=status.HTTP_204_NO_CONTENT)
 async def change_password(user: user_dependency, db: db_dependency, user_verification: UserVerification):
     if user is None:
         raise HTTPException(status_code=401, detail="Authentication failed")
     
-    user_model = db.query(Users).filter(Users.id == user.get('id')).first()
+    result = await db.execute(select(Users).where(Users.id == user.get('id')))
+    user_model = result.scalars().first()
 
     if not bcrypt_context.verify(user_verification.password, user_model.hashed_password):
         raise HTTPException(status_code=401, detail="Error on password change")
@@ -47,4 +43,4 @@ async def change_password(user: user_dependency, db: db_dependency, user_verific
     user_model.hashed_password = bcrypt_context.hash(user_verification.new_password)
 
     db.add(user_model)
-    db.commit()
\ No newline at end of file
+    await db.commit()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 SQLALCHEMY_DATABASE_URL = 'sqlite:///./mi_base.db'
@@ -8,6 +8,21 @@ SQLALCHEMY_DATABASE_URL = 'sqlite:///./mi_base.db'
 # porque SQLite por defecto solo permite un hilo, y FastAPI usa varios.
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={'check_same_thread' : False})
 
+# PRAGMAs de SQLite en cada conexión nueva
+# - journal_mode=WAL: los lectores no se bloquean mientras alguien escribe
+# - synchronous=NORMAL: seguro con WAL y con muchos menos fsync
+# - temp_store / cache_size: temporales en memoria y ~64 MB de caché de páginas
+# - busy_timeout: esperar hasta 5 s por el bloqueo de escritura en lugar de fallar
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
 # Fabrica de sesiones
 # una fábrica (una clase) que generará sesiones bajo demanda.
 SessionLocal = sessionmaker(autocommit = False, autoflush=False, bind=engine)
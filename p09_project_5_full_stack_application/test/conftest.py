@@ -0,0 +1,43 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+import pytest
+from ..database import Base
+from .utils import SQLALCHEMY_DATABASE_URL, TestingSessionLocal
+
+# Motor de pruebas perezoso: se crea al iniciar la sesión de pytest y no al
+# importar utils, y las tablas se crean una sola vez.
+# StaticPool mantiene una única conexión, así todas las sesiones (tests y app)
+# ven la misma base de datos en memoria.
+@pytest.fixture(scope="session", autouse=True)
+def db_engine():
+    engine = create_engine( # Motor de la base de datos
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # En pruebas la durabilidad no importa: synchronous=OFF evita los fsync.
+    # En :memory: el journal_mode se queda en "memory"; WAL solo aplica si
+    # SQLALCHEMY_DATABASE_URL apunta a un fichero
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    TestingSessionLocal.configure(bind=engine)
+    Base.metadata.create_all(bind=engine) # Crear tablas definidas en los modelos
+
+    yield engine
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+# Sesión compartida por los fixtures de datos (test_todo, test_user, cleanup_db)
+@pytest.fixture(scope="session")
+def db(db_engine):
+    session = TestingSessionLocal()
+    yield session
+    session.close()
@@ -1,7 +1,5 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
-from ..database import Base
 from ..main import app
 from fastapi.testclient import TestClient
 import pytest
@@ -9,17 +7,12 @@ from ..models import Todos, Users
 from ..routers.auth import bcrypt_context
 
 # Configurar bases de datos de pruebas
-SQLALCHEMY_DATABASE_URL = "sqlite:///./testdb.db"
+# Base en memoria: cada proceso (o worker de pytest-xdist) tiene la suya
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
-engine = create_engine( # Motor de la base de datos
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool
-)
-
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-Base.metadata.create_all(bind=engine) # Crear tablas definidas en los modelos
+# Fábrica de sesiones sin motor: el fixture db_engine de conftest.py
+# crea el motor al arrancar la sesión de pytest y la enlaza con configure()
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 # Sobre escritura de inyeccion de dependencias
 def override_get_db():
@@ -36,12 +29,23 @@ def override_get_current_user():
 client = TestClient(app)
 
 # Fixtures
+# El motor y la sesión compartida (db) están en conftest.py para que se
+# creen una sola vez por sesión y no una vez por cada módulo que importa utils.
+# Vacía todas las tablas al terminar el test en una sola transacción,
+# en lugar de un DELETE + COMMIT por cada fixture.
+@pytest.fixture
+def cleanup_db(db):
+    yield
+    db.execute(text("DELETE FROM todos"))
+    db.execute(text("DELETE FROM users"))
+    db.commit()
+    db.expunge_all()
+
 # Crean una tarea, usuario, los guardan y los entregan al test.
-# Después de cada test que use los fixtures, se ejecuta un 
-# bloque para vaciar la tabla de todos.
+# La limpieza la hace cleanup_db después de cada test.
 
 @pytest.fixture
-def test_todo():
+def test_todo(db, cleanup_db):
     todo = Todos(
         title="Learn FastAPI",
         description="Need to learn everyday",
@@ -50,18 +54,13 @@ def test_todo():
         owner_id=1,
     )
 
-    db = TestingSessionLocal()
     db.add(todo)
     db.commit()
 
     yield todo
 
-    with engine.connect() as connection:
-        connection.execute(text("DELETE FROM todos;"))
-        connection.commit()
-
 @pytest.fixture
-def test_user():
+def test_user(db, cleanup_db):
     user = Users(
         username="FepDev25",
         email="felipe@gmail.com",
@@ -72,12 +71,7 @@ def test_user():
         phone_number="0987654321"
     )
 
-    db = TestingSessionLocal()
     db.add(user)
     db.commit()
 
-    yield user
-
-    with engine.connect() as connection:
-        connection.execute(text("DELETE FROM users;"))
-        connection.commit()
\ No newline at end of file
+    yield user
\ No newline at end of file